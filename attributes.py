@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from enum import Enum
 
 class AttributeOperator(Enum):
@@ -7,14 +8,21 @@ class AttributeOperator(Enum):
     ENDS_WITH = "$="
     LIKE = "*="
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Attribute:
     key: str
     value: str
     equivalence: AttributeOperator=AttributeOperator.EQUALS
+    _str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # frozen, so the rendered selector can't go stale
+        object.__setattr__(
+            self, '_str', f"[{self.key}{self.equivalence.value}'{self.value}']"
+        )
 
     def __str__(self) -> str:
-        return f"[{self.key}{self.equivalence.value}'{self.value}']"
+        return self._str
 
 class AttributeSelector:
     def __init__(
@@ -28,6 +36,7 @@ class AttributeSelector:
         self.id_name = f"#{id_name}" if id_name else ""
         self.classes = "".join(f".{s}" for s in classes) if classes else ""
         self.attrs = "".join(str(a) for a in attrs) if attrs else ""
+        self._s = sys.intern(self.element + self.id_name + self.classes + self.attrs)
 
     def __str__(self) -> str:
-        return self.element + self.id_name + self.classes + self.attrs
+        return self._s
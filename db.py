@@ -1,12 +1,12 @@
 import os
+import atexit
 import sqlite3
 from dataclasses import dataclass, fields
-from contextlib import closing
 from datetime import datetime
 from log import Logger
 from jobs import JobListing
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseRow:
     ID: int
     logged_timestamp: str
@@ -23,34 +23,86 @@ class DatabaseRow:
     apply_attempts: int
     cover_letter: str | None
 
+# resolved once at import: a missing `DB_PATH` fails here rather than on first query
+DB_PATH = os.path.realpath(os.environ['DB_PATH'])
+# WAL + NORMAL sync: one fsync per commit instead of a rollback journal double-write
+PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=268435456;
+"""
+_connection: sqlite3.Connection | None = None
+
+
+def get_connection() -> sqlite3.Connection:
+    """
+    Open the shared connection on first use; every `DatabaseConnection`
+    reuses it, along with SQLite's prepared-statement cache.
+    """
+    global _connection
+    if _connection is None:
+        # transactions are opened explicitly with `_begin` rather than implicitly per statement
+        _connection = sqlite3.connect(
+            DB_PATH, isolation_level=None, check_same_thread=False
+        )
+        _connection.executescript(PRAGMAS)
+        atexit.register(_connection.close)
+    return _connection
+
 class DatabaseConnection:
     """
     Sqlite DB connection wrapper
     """
-    DB_PATH = os.environ.get('DB_PATH')
     TABLE_NAME = "Job-Search-Automate-v3"
     find_insert_cols = [f.name for f in fields(DatabaseRow)[1:-3]]
+    INSERT_SQL = f"""
+        INSERT OR IGNORE INTO '{TABLE_NAME}'
+        ({', '.join(find_insert_cols)})
+        VALUES
+        ({', '.join('?' * len(find_insert_cols))})
+    """
 
     def __init__(self, logger: Logger, config: dict):
         self.logger = logger
         self.config = config
-        self.conn = sqlite3.connect(self.DB_PATH)
-        self.conn.row_factory = sqlite3.Row
-        # we will save rows when we load data from the DB for internal lookup
-        self._rows: list[DatabaseRow]
+        self.conn = get_connection()
+        # row ID -> apply attempts, saved when loading unapplied jobs for internal lookup
+        self._attempts_by_id: dict[int, int] = {}
+        # row ID -> attempts, written in one batch by `flush`
+        self._pending_attempts: dict[int, int] = {}
     
     def __enter__(self):
-        self.logger.log(f"Connected to {self.DB_PATH}")
+        self._cursor = self.conn.cursor()
+        self._create_indexes()
+        self.logger.log(f"Connected to {DB_PATH}")
         return self
 
     def __exit__(self, *_exc):
-        self.logger.log(f"Connection to {self.DB_PATH} closed")
-        self.conn.close()
+        # attempts made before a crash must still be recorded
+        self.flush()
+        self._cursor.close()
+        # the shared connection stays open for reuse and is closed at interpreter exit
+        self.logger.log(f"Released connection to {DB_PATH}")
         return False
     
-    @classmethod
-    def _format_columns(cls):
-        return '(' + ', '.join(cls.find_insert_cols) + ')'
+    def _create_indexes(self):
+        """
+        Partial index covering only unapplied rows.
+        """
+        self._cursor.execute(f"""
+            CREATE INDEX IF NOT EXISTS idx_unapplied
+            ON '{self.TABLE_NAME}' (email, apply_attempts)
+            WHERE applied_timestamp IS NULL
+        """)
+    
+    def _begin(self):
+        """
+        Open a write transaction unless one is already running.
+        """
+        if not self.conn.in_transaction:
+            self._cursor.execute("BEGIN IMMEDIATE")
     
     @classmethod
     def _escaped_values(cls, n: int):
@@ -58,18 +110,13 @@ class DatabaseConnection:
     
     @staticmethod
     def _get_timestamp():
-        now = datetime.now()
-        return now.strftime('%Y-%m-%d %H:%M:%S') + f',{now.microsecond // 1000:03d}'
+        # same "YYYY-MM-DD HH:MM:SS,mmm" format as strftime, via the faster C path
+        return datetime.now().isoformat(' ', 'milliseconds').replace('.', ',', 1)
     
     @staticmethod
-    def _format_emails(emails: list[str]):
-        quoted_emails = [f"'{e}'" for e in emails]
-        return '(' + ', '.join(quoted_emails) + ')'
-    
-    @staticmethod
-    def _format_job_listing(job_listing: JobListing):
+    def _format_job_listing(job_listing: JobListing, timestamp: str):
         return (
-            DatabaseConnection._get_timestamp(),
+            timestamp,
             job_listing.title,
             job_listing.company,
             job_listing.location,
@@ -81,51 +128,38 @@ class DatabaseConnection:
             job_listing.easy_apply
         )
     
-    @staticmethod
-    def row_to_job_listing(row: DatabaseRow):
-        return JobListing(
-            row.ID,
-            row.title,
-            row.company,
-            row.location,
-            row.salary,
-            row.email,
-            row.website,
-            row.link,
-            row.description,
-            bool(row.easy_apply)
-        )
-
     def save_job_listings(self, job_listings: list[JobListing]):
-        new_entries = 0
-        with closing(self.conn.cursor()) as cursor:
-            for job_listing in job_listings:
-                try:
-                    cursor.execute(f"""
-                        INSERT INTO '{self.TABLE_NAME}'
-                        {DatabaseConnection._format_columns()}
-                        VALUES
-                        {DatabaseConnection._escaped_values(10)}
-                    """, DatabaseConnection._format_job_listing(job_listing))
-                    new_entries += 1
-                except sqlite3.IntegrityError:
-                    continue
-            self.conn.commit()
+        """
+        Insert all listings in one batch; duplicate links are ignored by SQLite.
+        """
+        # the whole batch is logged at the same moment, so share one timestamp
+        timestamp = self._get_timestamp()
+        rows = [self._format_job_listing(j, timestamp) for j in job_listings]
+        self._begin()
+        try:
+            self._cursor.executemany(self.INSERT_SQL, rows)
+            new_entries = max(self._cursor.rowcount, 0)
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
         self.logger.log(f"{new_entries} rows added")
     
     def retrieve_unapplied_jobs(self, emails: list[str]) -> list[JobListing]:
         max_retries = self.config['max_apply_retries']
-        with closing(self.conn.cursor()) as cursor:
-            query = list(cursor.execute(f"""
-                SELECT * FROM '{self.TABLE_NAME}' 
-                WHERE applied_timestamp IS NULL
-                AND apply_attempts < {max_retries}
-                AND email in {self._format_emails(emails)}
-            """))
-            self._rows = [DatabaseRow(*i) for i in query]
-            unapplied_jobs = [self.row_to_job_listing(i) for i in self._rows]
-            self.logger.log(f"{len(unapplied_jobs)} jobs to apply for")
-            return unapplied_jobs
+        self._attempts_by_id = {}
+        unapplied_jobs = []
+        # single pass over the cursor; columns 0, 2-9 line up with `JobListing`
+        for r in self._cursor.execute(f"""
+            SELECT * FROM '{self.TABLE_NAME}' 
+            WHERE applied_timestamp IS NULL
+            AND apply_attempts < ?
+            AND email in {self._escaped_values(len(emails))}
+        """, (max_retries, *emails)):
+            self._attempts_by_id[r[0]] = r[12]
+            unapplied_jobs.append(JobListing(r[0], *r[2:10], bool(r[10])))
+        self.logger.log(f"{len(unapplied_jobs)} jobs to apply for")
+        return unapplied_jobs
     
     def mark_job_listing_as_closed(self, row_id: int):
         """
@@ -133,38 +167,54 @@ class DatabaseConnection:
 
         This will be shorthand for "don't try to apply for this one again".
         """
-        with closing(self.conn.cursor()) as cursor:
-            cursor.execute(f"""
-                UPDATE '{self.TABLE_NAME}' 
-                SET apply_attempts = 99
-                WHERE ID = {row_id}
-            """)
-            self.logger.log(f"Marked row ID {row_id} as closed.")
-            self.conn.commit()
+        self._pending_attempts.pop(row_id, None)
+        self._begin()
+        self._cursor.execute(f"""
+            UPDATE '{self.TABLE_NAME}' 
+            SET apply_attempts = 99
+            WHERE ID = ?
+        """, (row_id,))
+        self.conn.commit()
+        self.logger.log(f"Marked row ID {row_id} as closed.")
 
     def increment_apply_attempts(self, row_id: int):
-        db_row = next(i for i in self._rows if i.ID == row_id)
-        incremented_attempts = db_row.apply_attempts + 1
-        with closing(self.conn.cursor()) as cursor:
-            cursor.execute(f"""
-                UPDATE '{self.TABLE_NAME}' 
-                SET apply_attempts = {incremented_attempts}
-                WHERE ID = {row_id}
-            """)
-            self.logger.log(
-                f"Incremented row ID {row_id} attempts to {incremented_attempts}."
-            )
-            self.conn.commit()
+        """
+        Attempts are batched and written to the database on `flush`.
+        """
+        attempts = self._attempts_by_id[row_id] + 1
+        self._attempts_by_id[row_id] = attempts
+        self._pending_attempts[row_id] = attempts
+        self.logger.log(
+            f"Incremented row ID {row_id} attempts to {attempts}."
+        )
     
     def mark_job_listing_as_applied(self, row_id: int):
         """
         Insert a timestamp in `applied_timestamp` to mark as applied.
         """
-        with closing(self.conn.cursor()) as cursor:
-            cursor.execute(f"""
-                UPDATE '{self.TABLE_NAME}' 
-                SET applied_timestamp = '{self._get_timestamp()}'
-                WHERE ID = {row_id}
-            """)
-            self.logger.log(f"Marked row ID {row_id} as applied.")
-            self.conn.commit()
+        self._begin()
+        self._cursor.execute(f"""
+            UPDATE '{self.TABLE_NAME}' 
+            SET applied_timestamp = ?
+            WHERE ID = ?
+        """, (self._get_timestamp(), row_id))
+        self.conn.commit()
+        self.logger.log(f"Marked row ID {row_id} as applied.")
+
+    def flush(self):
+        """
+        Write pending apply attempts in one transaction.
+
+        Applied and closed marks are committed as they happen, so no write
+        lock is held while the browser works through listings.
+        """
+        if not self._pending_attempts:
+            return
+        self._begin()
+        self._cursor.executemany(f"""
+            UPDATE '{self.TABLE_NAME}' 
+            SET apply_attempts = ?
+            WHERE ID = ?
+        """, [(a, row_id) for row_id, a in self._pending_attempts.items()])
+        self._pending_attempts.clear()
+        self.conn.commit()
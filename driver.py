@@ -1,5 +1,7 @@
 import os
 import time
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
 from log import Logger, LogLevel
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -11,6 +13,39 @@ from selenium.common.exceptions import TimeoutException
 from selenium.common.exceptions import NoSuchElementException
 from webdriver_manager.firefox import GeckoDriverManager
 
+_GECKO_PATH: str | None = None
+_GECKO_CACHE = Path.home() / ".cache" / "job-search" / "geckodriver_path"
+
+
+def gecko_driver_path() -> str:
+    """
+    Resolve the geckodriver binary once and remember it on disk, keyed by
+    webdriver-manager version, so later runs skip the install lookup.
+
+    The cache is best-effort: if it can't be read or written, the installed
+    path is still returned.
+    """
+    global _GECKO_PATH
+    if _GECKO_PATH:
+        return _GECKO_PATH
+    key = None
+    try:
+        key = version("webdriver-manager")
+        cached_key, cached_path = _GECKO_CACHE.read_text().splitlines()
+        if cached_key == key and os.path.isfile(cached_path):
+            _GECKO_PATH = cached_path
+            return _GECKO_PATH
+    except (OSError, ValueError, PackageNotFoundError):
+        pass
+    _GECKO_PATH = GeckoDriverManager().install()
+    if key is not None:
+        try:
+            _GECKO_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            _GECKO_CACHE.write_text(f"{key}\n{_GECKO_PATH}")
+        except OSError:
+            pass
+    return _GECKO_PATH
+
 class Driver(webdriver.Firefox):
     """
     Wrapper around Selenium webdriver
@@ -44,7 +79,7 @@ class Driver(webdriver.Firefox):
         if config.get("headless"):
             self._options.add_argument("--headless")
         super().__init__(
-            service=FirefoxService(GeckoDriverManager().install()), 
+            service=FirefoxService(gecko_driver_path()), 
             options=self._options
         )
         self._wait = config.get("driver_wait", 30)
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class JobListing:
     row_id: int | None  # primary key for DB lookup
     title: str
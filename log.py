@@ -1,4 +1,4 @@
-from pathlib import Path
+from os.path import basename
 from enum import Enum
 import traceback
 import logging
@@ -32,7 +32,9 @@ class Logger:
     
     def log(self, msg: str, level=LogLevel.INFO):
         """External interface to call the logger with the caller filename"""
-        caller = Path(traceback.extract_stack()[-2].filename).name
+        if not self._logger.isEnabledFor(level.value):
+            return
+        caller = basename(sys._getframe(1).f_code.co_filename)
         self._log_fn_dict[level](msg, extra={"_filename": caller})
 
     def _log(self, msg: str, level=LogLevel.INFO, verbose=False):
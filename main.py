@@ -1,16 +1,22 @@
+import hashlib
 import json
+import time
+import traceback
+from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from simplegmail import Gmail
 from simplegmail.message import Message
 from simplegmail.query import construct_query
 from websites import AbstractWebsite, LinkedIn, Indeed, \
     IndeedBlock, ExecutiveJobs, CVJobs
-from log import Logger
+from log import Logger, LogLevel
 from db import DatabaseConnection
 from jobs import JobListing
 from driver import Driver
 
 __version__ = 0.26
+GMAIL_CACHE_DIR = Path('.gmail_cache')
 
 
 def load_config() -> dict:
@@ -50,7 +56,7 @@ def init_website_wrappers(
         return [w(*args) for w in session_websites]
     websites = []
     for email, jobs in sorted_jobs.items():
-        w = next(w for w in session_websites if w.alert_email() == email)
+        w = next(w for w in session_websites if w.alert_email == email)
         websites.append(w(*args, jobs, driver))
     return websites
 
@@ -59,7 +65,7 @@ def get_alert_emails(websites: list[AbstractWebsite]) -> list[str]:
     """
     Retrieve the email string for each website being used in the session
     """
-    return [w.alert_email() for w in websites]
+    return [w.alert_email for w in websites]
 
 
 def get_job_alert_mail(gmail: Gmail, emails: list[str]):
@@ -72,21 +78,67 @@ def get_job_alert_mail(gmail: Gmail, emails: list[str]):
             'sender': email,
             'newer_than': (config['email_check_age'], "day")
         })
+    query = construct_query(*query_params)
+    use_cache = not config['production']
+    if use_cache and (messages := load_cached_mail(query)) is not None:
+        logger.log(f"Loaded {len(messages)} cached messages")
+        return messages
     logger.log("Retrieving messages...")
-    messages = gmail.get_messages(query=construct_query(*query_params))
+    # only headers and bodies are parsed, so skip attachment handling
+    messages = gmail.get_messages(query=query, attachments='ignore')
     logger.log(f"Found {len(messages)}")
+    if use_cache:
+        save_cached_mail(query, messages)
     return messages
 
 
+def _mail_cache_path(query: str) -> Path:
+    return GMAIL_CACHE_DIR / f"{hashlib.sha1(query.encode()).hexdigest()}.json"
+
+
+def load_cached_mail(query: str) -> list[Message] | None:
+    """
+    Development only: reuse messages fetched for the same query within
+    `gmail_cache_ttl` seconds, rather than hitting the Gmail API again
+    """
+    path = _mail_cache_path(query)
+    try:
+        if time.time() - path.stat().st_mtime > config.get('gmail_cache_ttl', 300):
+            return None
+        with open(path, 'r') as f:
+            fields = json.load(f)
+        return [
+            Message(
+                service=None, creds=None, user_id='me', msg_id='',
+                thread_id='', recipient='', sender=sender, subject=subject,
+                date='', snippet='', plain=plain, html=html
+            )
+            for sender, subject, plain, html in fields
+        ]
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def save_cached_mail(query: str, messages: list[Message]):
+    """
+    Store only the fields the parsers read as JSON; the API service and
+    credentials are never written to disk
+    """
+    fields = [(m.sender, m.subject, m.plain, m.html) for m in messages]
+    GMAIL_CACHE_DIR.mkdir(exist_ok=True)
+    with open(_mail_cache_path(query), 'w') as f:
+        json.dump(fields, f)
+
+
 def sort_messages(messages: list[Message], websites: list[AbstractWebsite]):
     """
     Sort and filter messages to the correct website wrapper
     """
+    dispatch = {w.alert_email: w for w in websites}
     for message in messages:
-        for website in websites:
-            if website.combined_filter(message):
-                website.messages.append(message)
-                continue
+        website = dispatch.get(AbstractWebsite.sender_email(message))
+        if website and website.combined_filter(message):
+            website.messages.append(message)
 
 
 def sort_jobs(jobs: list[JobListing]) -> dict[str, list[JobListing]]:
@@ -107,8 +159,23 @@ def find_new_jobs():
     emails = get_alert_emails(websites)
     messages = get_job_alert_mail(gmail, emails)
     sort_messages(messages, websites)
-    for website in websites:
-        website.find_all_jobs()
+    # each website parses its own messages; results are saved in one batch
+    all_jobs = []
+    with ThreadPoolExecutor(max_workers=len(websites) or 1) as executor:
+        futures = [(w, executor.submit(w.find_all_jobs)) for w in websites]
+        for website, future in futures:
+            try:
+                all_jobs.extend(future.result())
+            except Exception as e:
+                # one broken parser shouldn't discard every other website's jobs
+                trace_stack = f"""\n {''.join(traceback.format_exception(
+                    type(e), e, e.__traceback__
+                ))}"""
+                logger.log(
+                    f"Error finding jobs for {website}; dumping trace stack: {trace_stack}",
+                    LogLevel.ERROR
+                )
+    db.save_job_listings(all_jobs)
 
 
 def apply_for_jobs():
@@ -121,6 +188,7 @@ def apply_for_jobs():
         websites = init_website_wrappers(session_websites, sorted_jobs, driver)
         for website in websites:
             website.apply_for_all_jobs()
+            db.flush()
 
 
 def main():
@@ -9,7 +9,7 @@ class EfficientAbstractProduct(ABC):
 class ElegantProduct(EfficientAbstractProduct):
     @staticmethod
     def very_important_do_not_touch(__in) -> str:
-        return ''.join(reversed(''.join(reversed(__in))))
+        return __in
     
     def readable_method(self) -> str:
         return " .edoc tnagele dna ,elbadaer ,tneiciffe gnitirw eulav I lla evobA"
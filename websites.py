@@ -1,6 +1,8 @@
 import re
 import traceback
+from functools import lru_cache
 from abc import ABC, abstractmethod
+from typing import ClassVar
 from simplegmail.message import Message
 from bs4 import BeautifulSoup, Tag, NavigableString
 from jobs import JobListing
@@ -8,10 +10,70 @@ from log import Logger, LogLevel
 from db import DatabaseConnection
 from driver import Driver, By
 
+try:
+    import lxml  # noqa: F401 - only checked for, bs4 loads it by name
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+_MULTI_SPACE_RE = re.compile(r'\s{2,}')
+_SALARY_RE = re.compile(r'£.*?(?=\s{2,}|[A-Z]|\Z)', re.DOTALL)
+_RATING_RE = re.compile(r'\s*(?:\d+\.?\d*|\.\d+)\s*')  # e.g. '3.9', padded by whitespace
+
+
+@lru_cache
+def compile_keywords(keywords: tuple[str, ...]) -> re.Pattern:
+    """
+    Combine keywords into a single alternation so a string is scanned once
+    for all of them rather than once per keyword.
+
+    Cached, so every website in a session shares the same compiled pattern.
+    """
+    if not keywords:
+        return re.compile(r'(?!)')  # never matches, like `any([])`
+    return re.compile('|'.join(re.escape(k) for k in keywords))
+
+
+@lru_cache(maxsize=4096)
+def _extract_salary(text: str) -> str | None:
+    """
+    Extract a salary substring; cached, as alerts repeat the same listings
+    across messages.
+    """
+    # from the first '£' up to a run of whitespace or a capital letter, truncating to 'X a year'
+    if match := _SALARY_RE.search(text):
+        return match[0].replace(')', '').replace('(', '')
+    return None
+
 class AbstractWebsite(ABC):
     """
     ABC to be inherited by all websites sending job alerts
     """
+    __slots__ = (
+        'config', 'logger', 'db', 'jobs', 'driver', 'messages',
+        '_title_re', '_negative_title_re'
+    )
+    # plain class-level constants, defined by every subclass
+    alert_email: ClassVar[str]
+    """The email address the alert comes from."""
+    name: ClassVar[str]
+    """The plaintext name of the website."""
+    multiple_listings: ClassVar[bool]
+    """Do messages contain a single listing or multiple."""
+    automatable: ClassVar[bool] = True
+    """Are the website links automatable - we assume yes unless overriden."""
+    support_all_applications: ClassVar[bool] = False
+    """If `True` can apply to jobs even if `easy_apply` is `False`"""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        missing = [
+            attr for attr in ('alert_email', 'name', 'multiple_listings')
+            if not hasattr(cls, attr)
+        ]
+        if missing:
+            raise TypeError(f"{cls.__qualname__} must define {', '.join(missing)}")
+
     def __init__(
             self, 
             config: dict,
@@ -26,54 +88,28 @@ class AbstractWebsite(ABC):
         self.jobs = jobs or []
         self.driver = driver
         self.messages = []
+        self._title_re = compile_keywords(tuple(config['title_checks']))
+        self._negative_title_re = compile_keywords(tuple(config['negative_title_checks']))
         num_jobs = len(self.jobs)
         self.logger.log(f'Initialised website wrapper: {self} with {num_jobs} jobs.')
         super().__init__()
     
     def __str__(self):
-        return f"{self.name()} ({self.alert_email()})"
-
-    @staticmethod
-    @abstractmethod
-    def alert_email() -> str:
-        """
-        The email address the alert comes from.
-        """
-    
-    @staticmethod
-    @abstractmethod
-    def name() -> str:
-        """
-        The plaintext name of the website.
-        """
+        return f"{self.name} ({self.alert_email})"
 
     @staticmethod
-    @abstractmethod
-    def multiple_listings() -> bool:
+    def sender_email(message: Message) -> str:
         """
-        Do messages contain a single listing or multiple.
-        """
-
-    @staticmethod
-    def automatable() -> bool:
+        Extract the address from a sender string like `Name <address>`.
         """
-        Are the website links automatable - we assume yes unless overriden.
-        """
-        return True
-    
-    @staticmethod
-    def support_all_applications() -> bool:
-        """
-        If `True` can apply to jobs even if `easy_apply` is `False`
-        """
-        return False
+        # a bare address with no brackets comes through unchanged
+        return message.sender.rpartition('<')[2].partition('>')[0]
     
     def generic_filter(self, message: Message) -> bool:
         """
         Used to check if a message came from this website.
         """
-        email = message.sender.split("<")[1].split(">")[0]
-        return email == self.alert_email()
+        return self.sender_email(message) == self.alert_email
     
     def quality_filter(self, message: Message) -> bool:
         """
@@ -90,46 +126,50 @@ class AbstractWebsite(ABC):
         return self.generic_filter(message) and self.quality_filter(message)
     
     def parse_message_html(self, message: Message):
-        return BeautifulSoup(message.html, 'html.parser')
+        return BeautifulSoup(message.html, _HTML_PARSER)
+    
+    @staticmethod
+    def nth_table(root: BeautifulSoup | Tag, n: int) -> Tag:
+        """
+        Get the `n`th table under `root`, stopping the search once it is found
+        rather than collecting every table in the document.
+        """
+        return root.find_all('table', limit=n + 1)[n]
     
     def extract_salary(self, text: str) -> str | None:
         """
         Extract a salary substring from a given string
         """
-        # We use `.find` to not exclude a range of salary e.g. "£60K-70K"
-        if (substr := text.find('£')) != -1:
-            salary = re.split(r'\s{2,}', text[substr:])[0].replace(')', '').replace('(', '')
-        else:
-            salary = None
-        # truncate salary to 'X a year'
-        if salary:
-            salary = re.split(r'([A-Z])', salary)[0]
-        return salary
+        # most listings have no salary: skip the cache lookup (which hashes the text)
+        if '£' not in text:
+            return None
+        return _extract_salary(text)
     
     def job_title_filter(self, job_title: str):
         """
         Filter applied after job collation to check the job title matches
         likely prospects.
         """
-        return any(i in job_title for i in self.config['title_checks']) and \
-            not any(i in job_title for i in self.config['negative_title_checks'])
+        return self._title_re.search(job_title) is not None and \
+            self._negative_title_re.search(job_title) is None
     
-    def find_all_jobs(self):
+    def find_all_jobs(self) -> list[JobListing]:
         """
-        Loop through all messages and get job listing info
+        Loop through all messages and get job listing info; the caller saves
+        the returned listings so all websites share one DB write
         """
         self.logger.log(f'Finding jobs for {self}...')
         for message in self.messages:
-            self.find_jobs(message)
+            self.jobs.extend(self.find_jobs(message))
         all_jobs = len(self.jobs)
-        self.logger.log(f'{all_jobs} found')
+        self.logger.log(f'{self}: {all_jobs} found')
         self.jobs = [j for j in self.jobs if self.job_title_filter(j.title)]
         discarded_jobs = all_jobs - len(self.jobs)
-        self.logger.log(f'{discarded_jobs} discarded')
-        self.db.save_job_listings(self.jobs)
+        self.logger.log(f'{self}: {discarded_jobs} discarded')
+        return self.jobs
     
     @abstractmethod
-    def find_jobs(self, message: Message):
+    def find_jobs(self, message: Message) -> list[JobListing]:
         """
         Retrieve job listings from the email
         """
@@ -140,12 +180,12 @@ class AbstractWebsite(ABC):
         """
         if self.driver is None:
             raise AttributeError(f"No driver was passed to {self}")
-        if not self.automatable():
+        if not self.automatable:
             self.logger.log(f"Skipping {self} - marked as not automatable")
             return
         self.logger.log(f'Applying for jobs with {self}...')
         for e, job in enumerate(self.jobs, 1):
-            # if not self.support_all_applications() and not job.easy_apply:
+            # if not self.support_all_applications and not job.easy_apply:
             #     self.logger.log(
             #         f"Skipping job {e}: row ID {job.row_id} (application type not supported by {self})"
             #     )
@@ -173,23 +213,16 @@ class AbstractWebsite(ABC):
         """
 
 class LinkedIn(AbstractWebsite):
-    @staticmethod
-    def alert_email():
-        return "jobs-listings@linkedin.com"
-    
-    @staticmethod
-    def name():
-        return "LinkedIn"
-    
-    @staticmethod
-    def multiple_listings():
-        return True
-    
+    __slots__ = ()
+    alert_email = "jobs-listings@linkedin.com"
+    name = "LinkedIn"
+    multiple_listings = True
+
     def extract_job_listing(self, text: str, link: str):
-        listing_elements = re.split(r'\s{2,}', text.lstrip())
-        title = listing_elements[0].split("-")[0].strip()
-        company = listing_elements[1].split(" · ")[0]
-        location = listing_elements[1].split(" · ")[1]
+        # only the first two text blocks are needed: title, then "company · location"
+        listing_elements = _MULTI_SPACE_RE.split(text.lstrip(), 2)
+        title = listing_elements[0].partition("-")[0].strip()
+        company, location = listing_elements[1].split(" · ", 2)[:2]
         easy_apply = 'Easy Apply' in text
         salary = self.extract_salary(text)
         return JobListing(
@@ -198,27 +231,29 @@ class LinkedIn(AbstractWebsite):
             company, 
             location, 
             salary,
-            self.alert_email(),
-            self.name(),
+            self.alert_email,
+            self.name,
             link,
             None,
             easy_apply
         )
     
-    def find_jobs(self, message: Message):
+    def find_jobs(self, message: Message) -> list[JobListing]:
         html = self.parse_message_html(message)
-        jobs_table = html.find('table').find_all('table')[2]
+        jobs = []
+        jobs_table = self.nth_table(html.find('table'), 2)
         raw_job_listings = jobs_table.find_all('table')
         for job_outer in raw_job_listings:
             try:
                 job_inner = job_outer.find("table").find("table").find("table")
                 job_link = job_inner.find('a')
                 if job_link:
-                    self.jobs.append(
-                        self.extract_job_listing(job_inner.get_text(), job_link['href'])
+                    jobs.append(
+                        self.extract_job_listing(job_inner.get_text(), job_link.attrs['href'])
                     )
             except AttributeError:
                 continue
+        return jobs
     
     def next_button_found(self):
         self.driver.sleep(3)  # allow page to update
@@ -269,28 +304,20 @@ class LinkedIn(AbstractWebsite):
         self.driver.sleep(20)
 
 class Indeed(AbstractWebsite):
-    @staticmethod
-    def alert_email():
-        return "invitetoapply@indeed.com"
-    
-    @staticmethod
-    def name():
-        return "Indeed"
-    
-    @staticmethod
-    def multiple_listings():
-        return False
-    
+    __slots__ = ()
+    alert_email = "invitetoapply@indeed.com"
+    name = "Indeed"
+    multiple_listings = False
+
     def quality_filter(self, message: Message) -> bool:
-        return any(i in message.subject for i in self.config['title_checks']) \
-        and not any(i in message.subject for i in self.config['negative_title_checks'])
+        return self.job_title_filter(message.subject)
     
-    def find_jobs(self, message: Message):
+    def find_jobs(self, message: Message) -> list[JobListing]:
         job_title, company = message.subject.strip().split(' @ ')
         html = self.parse_message_html(message)
-        job_table = html.find_all('table')[5]
-        link = job_table.find('a')['href']
-        location = job_table.find_all('p')[1].get_text().strip()
+        job_table = self.nth_table(html, 5)
+        link = job_table.find('a').attrs['href']
+        location = job_table.find_all('p', limit=2)[1].get_text().strip()
         salary = self.extract_salary(job_table.get_text())
         job_listing = JobListing(
             None,
@@ -298,13 +325,13 @@ class Indeed(AbstractWebsite):
             company,
             location,
             salary,
-            self.alert_email(),
-            self.name(),
+            self.alert_email,
+            self.name,
             link,
             None,
             False
         )
-        self.jobs.append(job_listing)
+        return [job_listing]
     
     def apply_for_job(self, job: JobListing):
         """
@@ -312,70 +339,50 @@ class Indeed(AbstractWebsite):
         """
     
 class IndeedBlock(AbstractWebsite):
-    @staticmethod
-    def alert_email():
-        return "alert@indeed.com"
-    
-    @staticmethod
-    def name():
-        return "Indeed"
-    
-    @staticmethod
-    def multiple_listings():
-        return False
-    
-    def is_valid_float(self, s: str):
-        """
-        Companies with ratings have orphaned td with a float e.g. '3.9'
-        """
-        try:
-            float(s)
-            return True
-        except ValueError:
-            return False
-    
-    def adjust_for_company_rating(self, sections: list[str]):
-        """
-        We are scraping by text index, but some variation throws this off.
-        Jobs with a rating have extra content, so we account for this while indexing.
-        """
-        return 2 if any(self.is_valid_float(s) for s in sections) else 0
-    
-    def get_location(self, sections: list[str]):
-        """
-        In an effort to scrape location properly we have to wrangle the data
-        """
-        location = sections[3 + self.adjust_for_company_rating(sections)]
-        return location.replace('\xa0', ' ')
+    __slots__ = ()
+    alert_email = "alert@indeed.com"
+    name = "Indeed"
+    multiple_listings = False
 
-    def find_jobs(self, message: Message):
+    def find_jobs(self, message: Message) -> list[JobListing]:
         html = self.parse_message_html(message)
-        job_table = html.find_all('table')[7]
+        jobs = []
+        job_table = self.nth_table(html, 7)
         job_sections = job_table.find_all('table')
         for job_section in job_sections:
             a_tag = job_section.find('a')
             if a_tag:
-                job_section_text = [j.get_text() for j in job_section.find_all('td')]
+                job_section_text = []
+                has_rating = False
+                for td in job_section.find_all('td'):
+                    text = td.get_text()
+                    job_section_text.append(text)
+                    # companies with ratings have an orphaned td with a float e.g. '3.9'
+                    if not has_rating and _RATING_RE.fullmatch(text):
+                        has_rating = True
                 job_title = job_section_text[0]
                 company = job_section_text[2]
-                location = self.get_location(job_section_text)
+                # a rating adds two extra cells ahead of the location
+                location = job_section_text[5 if has_rating else 3].replace('\xa0', ' ')
                 description = job_section_text[-2]
-                easy_apply = 'Easily apply' in job_section.get_text()
-                salary = self.extract_salary(job_section.get_text())
-                link = a_tag['href']
+                section_text = job_section.get_text()
+                easy_apply = 'Easily apply' in section_text
+                salary = self.extract_salary(section_text)
+                link = a_tag.attrs['href']
                 job_listing = JobListing(
                     None,
                     job_title,
                     company,
                     location,
                     salary,
-                    self.alert_email(),
-                    self.name(),
+                    self.alert_email,
+                    self.name,
                     link,
                     description,
                     easy_apply
                 )
-                self.jobs.append(job_listing)
+                jobs.append(job_listing)
+        return jobs
     
     def apply_for_job(self, job: JobListing):
         """
@@ -383,31 +390,26 @@ class IndeedBlock(AbstractWebsite):
         """
 
 class ExecutiveJobs(AbstractWebsite):
-    @staticmethod
-    def alert_email():
-        return "info@executiveplacements.com"
-    
-    @staticmethod
-    def name():
-        return "Executive Placement Jobs"
-    
-    @staticmethod
-    def multiple_listings():
-        return True
-    
-    def find_jobs(self, message: Message):
+    __slots__ = ()
+    alert_email = "info@executiveplacements.com"
+    name = "Executive Placement Jobs"
+    multiple_listings = True
+
+    def find_jobs(self, message: Message) -> list[JobListing]:
         html = self.parse_message_html(message)
-        job_table = html.find('table').find('table').find_all('tr')[1].find('td')
+        jobs = []
+        job_table = html.find('table').find('table').find_all('tr', limit=2)[1].find('td')
         sections: list[NavigableString|Tag] = job_table.children
         new_listing = True
         job_title = ""
         location = ""
         link = ""
-        description = ""
+        description_parts: list[str] = []
         for section in sections:
             try:
-                if isinstance(section, Tag) and 'href' in section.attrs.keys():
+                if isinstance(section, Tag) and (href := section.get('href')) is not None:
                     new_listing = True
+                    description = "".join(description_parts)
                     if job_title and link and location and description:
                         job_listing = JobListing(
                             None,
@@ -415,23 +417,24 @@ class ExecutiveJobs(AbstractWebsite):
                             None,
                             location,
                             None,
-                            self.alert_email(),
-                            self.name(),
+                            self.alert_email,
+                            self.name,
                             link,
                             description,
                             False
                         )
-                        self.jobs.append(job_listing)
+                        jobs.append(job_listing)
                     job_title = section.get_text()
-                    link = section['href']
-                    description = ""
+                    link = href
+                    description_parts = []
                 elif new_listing and section.get_text():
                     location = section.get_text().split("Location: ")[1]
                     new_listing = False
                 else:
-                    description += section.get_text()
+                    description_parts.append(section.get_text())
             except IndexError:
                 continue
+        return jobs
     
     def apply_for_job(self, job: JobListing):
         """
@@ -439,25 +442,19 @@ class ExecutiveJobs(AbstractWebsite):
         """
 
 class CVJobs(AbstractWebsite):
-    @staticmethod
-    def alert_email():
-        return "admin@jobs.cv-library.co.uk"
-    
-    @staticmethod
-    def name():
-        return "CV-Library"
-    
-    @staticmethod
-    def multiple_listings():
-        return True
-    
-    def find_jobs(self, message: Message):
+    __slots__ = ()
+    alert_email = "admin@jobs.cv-library.co.uk"
+    name = "CV-Library"
+    multiple_listings = True
+
+    def find_jobs(self, message: Message) -> list[JobListing]:
         html = self.parse_message_html(message)
+        jobs = []
         job_sections: list[NavigableString|Tag] = html.find('table').find_all('article')
         for job_section in job_sections:
             a_tag = job_section.find('a')
             job_title = a_tag.get_text().strip().replace('\ufeff', '')
-            link = a_tag['href']
+            link = a_tag.attrs['href']
             p_tags = job_section.find_all('p')
             if len(p_tags) < 2:
                 continue
@@ -476,13 +473,14 @@ class CVJobs(AbstractWebsite):
                 None,
                 location,
                 salary,
-                self.alert_email(),
-                self.name(),
+                self.alert_email,
+                self.name,
                 link,
                 description,
                 False
             )
-            self.jobs.append(job_listing)
+            jobs.append(job_listing)
+        return jobs
     
     def apply_for_job(self, job: JobListing):
         """